@@ -1,21 +1,31 @@
 from __future__ import annotations
 
 def modular_inverse(n: int, p: int) -> int:
-    """Fermat'nın Küçük Teoremi ile modüler tersi hesaplar: n^(p-2) ≡ n⁻¹ (mod p)"""
-    return pow(n, p - 2, p)
+    """
+    n'nin mod p tersini hesaplar.
+    pow(n, -1, p) genişletilmiş Öklid algoritmasını C içinde çalıştırır; Fermat
+    üssü (n^(p-2)) ile yapılan ~256 kare alma ve çarpmadan belirgin şekilde hızlıdır.
+    """
+    return pow(n, -1, p)
 
 # @dataclass'ı kaldır
 class Curve:
     """
     y^2 = x^3 + ax + b (mod p) formundaki bir eliptik eğriyi temsil eder.
     """
+    __slots__ = ('name', 'p', 'a', 'b', 'n', '_double', '_add', 'g', '_G_comb')
+
     def __init__(self, name: str, p: int, a: int, b: int, n: int, gx: int, gy: int):
         self.name = name
         self.p = p
         self.a = a
         self.b = b
         self.n = n
+        # Eğri sabitleri gömülü (specialize edilmiş) ikiye katlama ve toplama fonksiyonları
+        self._double, self._add = _specialize(self)
         self.g = Point(self, gx, gy)
+        # Üreteç noktası için sabit taban tablosu; ilk kullanımda doldurulur.
+        self._G_comb = None
 
     def __str__(self):
         return f'Curve("{self.name}")'
@@ -29,15 +39,23 @@ class Point:
     """
     Bir eliptik eğri üzerindeki bir noktayı temsil eder.
     """
-    def __init__(self, curve: Curve, x: int | None, y: int | None):
+    __slots__ = ('curve', 'x', 'y', '_jac')
+
+    def __init__(self, curve: Curve, x: int | None, y: int | None, _validate: bool = True):
         self.curve = curve
         self.x = x
         self.y = y
+        self._jac = None  # Jakoben karşılığı; _to_jacobian ilk çağrıda doldurur.
 
         # Sonsuzdaki nokta kontrolü
         if self.x is None and self.y is None:
             return
 
+        # İç aritmetiğin ürettiği noktalar zaten eğri üzerindedir; doğrulama
+        # yalnızca dışarıdan gelen koordinatlar için yapılır.
+        if not _validate:
+            return
+
         # Noktanın eğri üzerinde olduğunu doğrula
         if (self.y**2 - (self.x**3 + self.curve.a * self.x + self.curve.b)) % self.curve.p != 0:
             raise ValueError(f"Nokta ({self.x}, {self.y}) eğrinin üzerinde değil.")
@@ -67,37 +85,64 @@ class Point:
         if other.is_at_infinity():
             return self
 
+        curve = self.curve
         p_jac = _to_jacobian(self)
+
+        # P + P: toplama formülünün ara adımlarını atlayıp doğrudan ikiye katla.
+        # Karşılaştırma indirgenmiş Jakoben koordinatlarla ve yalnızca z = 1 olan
+        # (afin) işlenenler için yapılır; curve._add diğer durumları kendisi yakalar.
+        if self is other:
+            return JacobianPoint(curve, *curve._double(p_jac, curve))
         q_jac = _to_jacobian(other)
-        
-        r_jac = _jacobian_add(p_jac, q_jac, self.curve)
-        
-        return _from_jacobian(r_jac, self.curve)
+        if p_jac[2] == 1 and q_jac[2] == 1 and p_jac[0] == q_jac[0]:
+            if p_jac[1] != q_jac[1]:
+                return Point(curve, None, None)
+            return JacobianPoint(curve, *curve._double(p_jac, curve))
+
+        r_jac = curve._add(p_jac, q_jac, curve)
+
+        return JacobianPoint(curve, *r_jac)
 
 
     def __mul__(self, k: int) -> Point:
         """
-        Bir noktayı bir skaler ile çarpar (Jakoben koordinatları ile Double-and-Add).
+        Bir noktayı bir skaler ile çarpar (Jakoben koordinatları ile sabit 4 bitlik pencere).
+        Skaler, mertebenin bayt uzunluğuna doldurulur ve her pencere için aynı adımlar
+        (dört ikiye katlama, bir tablo toplaması) çağrılır. Bu sabit zamanlı değildir:
+        sıfır pencereler birim elemanla toplanır ve baştaki ikiye katlamalar birim eleman
+        üzerinde kısa devre yapar; Python tamsayı işlemleri de değere bağlı sürer.
         """
         if not isinstance(k, int):
             raise TypeError("Skaler bir tamsayı olmalıdır.")
 
-        if self.is_at_infinity() or k % self.curve.n == 0:
-            return Point(self.curve, None, None)
+        curve = self.curve
+        k %= curve.n  # Negatif skalerler de [0, n) aralığına taşınır.
 
-        if k < 0:
-            return (-k) * (-self)
+        if self.is_at_infinity() or k == 0:
+            return Point(curve, None, None)
 
-        result_jac = (1, 1, 0)  # Jakoben birim elemanı
-        current_jac = _to_jacobian(self)
+        # Üreteç noktası için önceden hesaplanmış tablo kullanılır.
+        g = curve.g
+        if self is g or (not isinstance(self, JacobianPoint) and self.x == g.x and self.y == g.y):
+            return fixed_base_mul(k, curve)
 
-        while k > 0:
-            if k & 1:
-                result_jac = _jacobian_add(result_jac, current_jac, self.curve)
-            current_jac = _jacobian_double(current_jac, self.curve)
-            k >>= 1
+        double = curve._double
+        add = curve._add
 
-        return _from_jacobian(result_jac, self.curve)
+        # Pencere tablosu: [O, P, 2P, ..., 15P]
+        base_jac = _to_jacobian(self)
+        table = [(1, 1, 0), base_jac, double(base_jac, curve)]
+        for _ in range(13):
+            table.append(add(table[-1], base_jac, curve))
+        table = _batch_to_affine(table, curve.p)
+
+        result_jac = (1, 1, 0)
+        for byte in k.to_bytes((curve.n.bit_length() + 7) // 8, 'big'):
+            for nibble in (byte >> 4, byte & 0xF):
+                result_jac = double(double(double(double(result_jac, curve), curve), curve), curve)
+                result_jac = add(result_jac, table[nibble], curve)
+
+        return JacobianPoint(curve, *result_jac)
 
     def __rmul__(self, k: int) -> Point:
         """k * P için skaler çarpmayı etkinleştirir."""
@@ -107,80 +152,308 @@ class Point:
         """Bir noktanın negatifini döndürür: (x, -y)."""
         if self.is_at_infinity():
             return self
-        return Point(self.curve, self.x, self.curve.p - self.y)
+        return Point(self.curve, self.x, self.curve.p - self.y, _validate=False)
+
+class JacobianPoint(Point):
+    """
+    Jakoben koordinatlarında (X, Y, Z) tutulan bir nokta.
+    Toplama ve çarpma sonuçları bu biçimde döner; afin x/y koordinatları yalnızca
+    ilk erişimde (ör. karşılaştırma veya serileştirme) tek bir ters alma ile hesaplanır.
+    """
+    __slots__ = ('X', 'Y', 'Z', '_affine')
+
+    def __init__(self, curve: Curve, X: int, Y: int, Z: int):
+        self.curve = curve
+        self.X = X
+        self.Y = Y
+        self.Z = Z
+        self._jac = (X, Y, Z)
+        self._affine = None
+
+    def _to_affine(self) -> Point:
+        if self._affine is None:
+            self._affine = _from_jacobian((self.X, self.Y, self.Z), self.curve)
+        return self._affine
+
+    @property
+    def x(self) -> int | None:
+        return self._to_affine().x
+
+    @property
+    def y(self) -> int | None:
+        return self._to_affine().y
+
+    def is_at_infinity(self) -> bool:
+        """Bu noktanın sonsuzdaki nokta olup olmadığını kontrol eder."""
+        return self.Z == 0
+
+    @property
+    def is_identity(self):
+        """Nokta, birim eleman (sonsuzdaki nokta) mı?"""
+        return self.Z == 0
+
+    def __neg__(self) -> Point:
+        """Bir noktanın negatifini döndürür: (X, -Y, Z)."""
+        if self.is_at_infinity():
+            return self
+        return JacobianPoint(self.curve, self.X, self.curve.p - self.Y, self.Z)
+
+# --- Çoklu Skaler Çarpım ---
+
+def _shamir_mul(k1: int, p1: Point, k2: int, p2: Point, curve: Curve) -> Point:
+    """
+    k1*P1 + k2*P2'yi tek bir ortak döngüde hesaplar (Shamir hilesi).
+    Her iki skaler 2 bitlik pencerelerle birlikte taranır; {i*P1 + j*P2 : i, j ∈ [0..3]}
+    tablosu sayesinde ikiye katlamalar iki çarpım arasında paylaşılır.
+    """
+    identity = (1, 1, 0)
+
+    def multiples(point: Point):
+        base = _to_jacobian(point)
+        double = curve._double(base, curve)
+        return [identity, base, double, curve._add(double, base, curve)]
+
+    m1 = multiples(p1)
+    m2 = multiples(p2)
+    table = [curve._add(a, b, curve) for a in m1 for b in m2]  # indeks: (i << 2) | j
+    table = _batch_to_affine(table, curve.p)
+
+    result_jac = identity
+    top = (max(k1.bit_length(), k2.bit_length()) + 1) & ~1
+    for shift in range(top - 2, -1, -2):
+        result_jac = curve._double(curve._double(result_jac, curve), curve)
+        idx = ((k1 >> shift) & 3) << 2 | ((k2 >> shift) & 3)
+        if idx:
+            result_jac = curve._add(result_jac, table[idx], curve)
+
+    return JacobianPoint(curve, *result_jac)
+
+# --- Sabit Taban (Üreteç) Çarpımı ---
+
+_COMB_WIDTH = 4
+
+def _build_g_comb(curve: Curve):
+    """
+    Her w bitlik pencere i için [j * 2^(w*i) * G : j ∈ [0..2^w - 1]] satırlarını
+    Jakoben koordinatlarında hesaplar (256 bitlik bir mertebe için 64 × 16 nokta).
+    """
+    size = 1 << _COMB_WIDTH
+    windows = -(-curve.n.bit_length() // _COMB_WIDTH)
+    base = _to_jacobian(curve.g)
+    rows = []
+    for _ in range(windows):
+        row = [(1, 1, 0), base]
+        for _ in range(size - 2):
+            row.append(curve._add(row[-1], base, curve))
+        rows.append(row)
+        base = curve._add(row[-1], base, curve)  # 2^w * base
+    flat = _batch_to_affine([point for row in rows for point in row], curve.p)
+    return [flat[i:i + size] for i in range(0, len(flat), size)]
+
+def fixed_base_mul(k: int, curve: Curve) -> Point:
+    """
+    k * G'yi önceden hesaplanmış tablo ile hesaplar: skaler w bitlik dilimlere
+    ayrılır ve her dilim, tablodaki tek bir noktanın eklenmesine karşılık gelir.
+    İkiye katlama gerekmez. Gizli skalerler (nonce, özel anahtar) için kullanıldığından
+    skalerin bit uzunluğundan bağımsız olarak tüm satırlar dolaşılır ve her satırda
+    bir toplama çağrılır.
+    """
+    k %= curve.n
+    if k == 0:
+        return Point(curve, None, None)
+
+    table = curve._G_comb
+    if table is None:
+        table = curve._G_comb = _build_g_comb(curve)
+
+    mask = (1 << _COMB_WIDTH) - 1
+    result_jac = (1, 1, 0)
+    add = curve._add
+    for row in table:
+        result_jac = add(result_jac, row[k & mask], curve)
+        k >>= _COMB_WIDTH
+
+    return JacobianPoint(curve, *result_jac)
 
 # --- Jakoben Koordinat Yardımcı Fonksiyonları ---
 
 def _to_jacobian(p: Point):
-    """Afin koordinatları Jakoben'e dönüştürür."""
-    if p.is_at_infinity():
-        return (1, 1, 0)
-    return (p.x, p.y, 1)
+    """
+    Afin koordinatları Jakoben'e dönüştürür (sonuç nokta üzerinde saklanır).
+    Point, eğri denklemini mod p doğruladığından [0, p) dışındaki koordinatları da
+    kabul eder; toplama formülleri indirgenmiş değerleri karşılaştırdığı için
+    koordinatlar burada indirgenir.
+    """
+    jac = p._jac
+    if jac is None:
+        if p.is_at_infinity():
+            jac = (1, 1, 0)
+        else:
+            field_p = p.curve.p
+            jac = (p.x % field_p, p.y % field_p, 1)
+        p._jac = jac
+    return jac
 
-def _from_jacobian(p, curve: Curve):
+def _from_jacobian(point, curve: Curve):
     """Jakoben koordinatları Afin'e dönüştürür."""
-    x, y, z = p
+    x, y, z = point
     if z == 0:
         return Point(curve, None, None)
-    
+
+    # Tek bir ters alma; z^-2 ve z^-3 bu tersten türetilir.
     z_inv = pow(z, -1, curve.p)
-    z_inv_sq = (z_inv * z_inv) % curve.p
-    
+    z_inv_sq = z_inv * z_inv
+
     x_aff = (x * z_inv_sq) % curve.p
     y_aff = (y * z_inv_sq * z_inv) % curve.p
-    
-    return Point(curve, x_aff, y_aff)
 
-def _jacobian_double(p, curve: Curve):
-    """Jakoben koordinatlarında bir noktayı ikiye katlar (point doubling)."""
-    x, y, z = p
+    return Point(curve, x_aff, y_aff, _validate=False)
+
+def _batch_to_affine(points, p: int):
+    """
+    Jakoben noktaları listesini tek bir modüler ters alma ile z = 1 olacak şekilde
+    normalize eder (Montgomery'nin eşzamanlı ters alma hilesi).
+    Sonsuzdaki noktalar (z = 0) olduğu gibi bırakılır.
+    """
+    # Ön ek çarpımları: prefix[i] = z_0 * z_1 * ... * z_(i-1)
+    prefix = []
+    acc = 1
+    for _, _, z in points:
+        prefix.append(acc)
+        if z:
+            acc = (acc * z) % p
+
+    inv = pow(acc, -1, p)
+
+    result = [None] * len(points)
+    for i in range(len(points) - 1, -1, -1):
+        x, y, z = points[i]
+        if not z:
+            result[i] = (1, 1, 0)
+            continue
+        z_inv = (inv * prefix[i]) % p
+        inv = (inv * z) % p
+        z_inv_sq = z_inv * z_inv
+        result[i] = ((x * z_inv_sq) % p, (y * z_inv_sq * z_inv) % p, 1)
+    return result
+
+# --- Eğriye Özel Kod Üretimi ---
+
+# a'nın özel değerlerine göre m = 3x^2 + a*z^4 hesabı
+_DOUBLE_M_SRC = {
+    'a0': "m = (3 * x * x) % {p}",
+    'a3': "z_sq = (z * z) % {p}\n    m = (3 * (x - z_sq) * (x + z_sq)) % {p}",
+    'generic': "z_sq = (z * z) % {p}\n    m = (3 * x * x + {a} * z_sq * z_sq) % {p}",
+}
+
+_SPECIALIZED_SRC = """
+def jdouble(point, curve=None):
+    x, y, z = point
     if y == 0 or z == 0:
         return (1, 1, 0)
 
-    y_sq = (y * y) % curve.p
-    s = (4 * x * y_sq) % curve.p
-    m = (3 * x * x + curve.a * pow(z, 4, curve.p)) % curve.p
-    
-    x_new = (m * m - 2 * s) % curve.p
-    y_new = (m * (s - x_new) - 8 * y_sq * y_sq) % curve.p
-    z_new = (2 * y * z) % curve.p
-    
+    y_sq = (y * y) % {p}
+    s = (4 * x * y_sq) % {p}
+    {m}
+
+    x_new = (m * m - 2 * s) % {p}
+    y_new = (m * (s - x_new) - 8 * y_sq * y_sq) % {p}
+    z_new = (2 * y * z) % {p}
+
     return (x_new, y_new, z_new)
 
-def _jacobian_add(p, q, curve: Curve):
-    """Jakoben koordinatlarında iki noktayı toplar (point addition)."""
-    x1, y1, z1 = p
-    x2, y2, z2 = q
+def jadd_mixed(point, qx, qy):
+    x1, y1, z1 = point
 
     if z1 == 0:
-        return q
+        return (qx, qy, 1)
+
+    z1_sq = (z1 * z1) % {p}
+
+    u2 = (qx * z1_sq) % {p}
+    s2 = (qy * z1_sq * z1) % {p}
+
+    if x1 == u2:
+        if y1 == s2:
+            return jdouble(point)
+        else:
+            return (1, 1, 0)
+
+    h = u2 - x1
+    r = s2 - y1
+
+    h_sq = (h * h) % {p}
+    h_cu = (h * h_sq) % {p}
+    v = (x1 * h_sq) % {p}
+
+    x3 = (r * r - h_cu - 2 * v) % {p}
+    y3 = (r * (v - x3) - y1 * h_cu) % {p}
+    z3 = (z1 * h) % {p}
+
+    return (x3, y3, z3)
+
+def jadd(p1, p2, curve=None):
+    x1, y1, z1 = p1
+    x2, y2, z2 = p2
+
+    if z1 == 0:
+        return p2
     if z2 == 0:
-        return p
-
-    z1_sq = (z1 * z1) % curve.p
-    z2_sq = (z2 * z2) % curve.p
-    
-    u1 = (x1 * z2_sq) % curve.p
-    u2 = (x2 * z1_sq) % curve.p
-    
-    s1 = (y1 * z2_sq * z2) % curve.p
-    s2 = (y2 * z1_sq * z1) % curve.p
-    
-    h = (u2 - u1) % curve.p
-    r = (s2 - s1) % curve.p
-    
-    if h == 0:
-        if r == 0:
-            return _jacobian_double(p, curve)
+        return p1
+
+    if z2 == 1:
+        return jadd_mixed(p1, x2, y2)
+    if z1 == 1:
+        return jadd_mixed(p2, x1, y1)
+
+    z1_sq = (z1 * z1) % {p}
+    z2_sq = (z2 * z2) % {p}
+
+    u1 = (x1 * z2_sq) % {p}
+    u2 = (x2 * z1_sq) % {p}
+
+    s1 = (y1 * z2_sq * z2) % {p}
+    s2 = (y2 * z1_sq * z1) % {p}
+
+    if u1 == u2:
+        if s1 == s2:
+            return jdouble(p1)
         else:
             return (1, 1, 0)
-            
-    h_sq = (h * h) % curve.p
-    h_cu = (h * h_sq) % curve.p
-    v = (u1 * h_sq) % curve.p
-    
-    x3 = (r * r - h_cu - 2 * v) % curve.p
-    y3 = (r * (v - x3) - s1 * h_cu) % curve.p
-    z3 = (z1 * z2 * h) % curve.p
-    
+
+    h = u2 - u1
+    r = s2 - s1
+
+    h_sq = (h * h) % {p}
+    h_cu = (h * h_sq) % {p}
+    v = (u1 * h_sq) % {p}
+
+    x3 = (r * r - h_cu - 2 * v) % {p}
+    y3 = (r * (v - x3) - s1 * h_cu) % {p}
+    z3 = (z1 * z2 * h) % {p}
+
     return (x3, y3, z3)
+"""
+
+def _specialize(curve: Curve):
+    """
+    Eğri parametreleri (p, a) kaynak koda sabit (literal) olarak gömülmüş
+    ikiye katlama ve toplama fonksiyonlarını üretir ve (jdouble, jadd) döndürür.
+    İç döngülerde öznitelik erişimi kalmaz; sabitler doğrudan bayt kodundan yüklenir.
+    Jakoben ikiye katlama/toplama formüllerinin tek kaynağı bu şablondur; fonksiyonlar
+    (point, curve) ve (p1, p2, curve) imzalarıyla çağrılır.
+    """
+    p, a = curve.p, curve.a
+    if a == 0:
+        kind = 'a0'
+    elif a == p - 3:
+        kind = 'a3'
+    else:
+        kind = 'generic'
+
+    m_src = _DOUBLE_M_SRC[kind].format(p=f"{p:#x}", a=f"{a:#x}")
+    src = _SPECIALIZED_SRC.format(p=f"{p:#x}", m=m_src)
+
+    namespace = {}
+    exec(compile(src, f"<ecc_core:{curve.name}>", "exec"), namespace)
+    return namespace['jdouble'], namespace['jadd']
@@ -1,14 +1,14 @@
 import hashlib
 import hmac
 import secrets
-from typing import Tuple
+from typing import Iterable, List, Tuple
 
 # Üst dizindeki modülleri import etmek için
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
 
-from ecc_core import Curve, Point
+from ecc_core import Curve, Point, _shamir_mul
 
 Signature = Tuple[int, int]
 
@@ -20,30 +20,48 @@ def generate_key_pair(curve: Curve) -> Tuple[int, Point]:
     return private_key, public_key
 
 
-def _rfc6979_k(priv_key: int, msg_hash: bytes, curve: Curve) -> int:
+def _hmac_sha256_prf(key: bytes):
     """
-    RFC 6979'a göre deterministik 'k' değeri üretir.
+    Verilen anahtarla bir kez anahtarlanmış HMAC-SHA256 durumunu döndürür.
+    Her çağrı bu durumu kopyalar; anahtar bloğu her mesaj için yeniden işlenmez.
+    """
+    base = hmac.new(key, None, hashlib.sha256)
+
+    def prf(msg: bytes) -> bytes:
+        h = base.copy()
+        h.update(msg)
+        return h.digest()
+
+    return prf
+
+
+def _rfc6979_nonces(priv_key: int, msg_hash: bytes, curve: Curve):
+    """
+    RFC 6979'a göre deterministik 'k' adaylarını sırayla üretir.
     Bu, zayıf RNG'lerden (rastgele sayı üreteci) kaynaklanan hataları önler.
+    Bir aday geçersiz bir imza (r == 0 veya s == 0) verirse, standart bir sonraki
+    adayın aynı durumdan devam edilerek üretilmesini gerektirir (Adım H3).
     """
     n = curve.n
     hash_len = len(msg_hash)
     n_len = (n.bit_length() + 7) // 8
+    priv_bytes = priv_key.to_bytes(n_len, 'big')
 
     # RFC 6979, Adım B, C
     v = b'\x01' * hash_len
-    k = b'\x00' * hash_len
+    prf = _hmac_sha256_prf(b'\x00' * hash_len)
 
     # RFC 6979, Adım D
-    k = hmac.new(k, v + b'\x00' + priv_key.to_bytes(n_len, 'big') + msg_hash, hashlib.sha256).digest()
+    prf = _hmac_sha256_prf(prf(v + b'\x00' + priv_bytes + msg_hash))
 
     # RFC 6979, Adım E
-    v = hmac.new(k, v, hashlib.sha256).digest()
+    v = prf(v)
 
     # RFC 6979, Adım F
-    k = hmac.new(k, v + b'\x01' + priv_key.to_bytes(n_len, 'big') + msg_hash, hashlib.sha256).digest()
+    prf = _hmac_sha256_prf(prf(v + b'\x01' + priv_bytes + msg_hash))
 
     # RFC 6979, Adım G
-    v = hmac.new(k, v, hashlib.sha256).digest()
+    v = prf(v)
 
     # RFC 6979, Adım H
     while True:
@@ -52,7 +70,7 @@ def _rfc6979_k(priv_key: int, msg_hash: bytes, curve: Curve) -> int:
 
         # H2: t'nin bit uzunluğu, grup mertebesinin bit uzunluğuna ulaşana kadar v'yi hash'le
         while len(t) < n_len:
-            v = hmac.new(k, v, hashlib.sha256).digest()
+            v = prf(v)
             t += v
 
         # H3: Aday k'yı türet
@@ -60,51 +78,90 @@ def _rfc6979_k(priv_key: int, msg_hash: bytes, curve: Curve) -> int:
         k_int >>= len(t) * 8 - n.bit_length()
 
         if 1 <= k_int < n:
-            return k_int
+            yield k_int
 
-        # Geçersiz k, tekrar dene
-        k = hmac.new(k, v + b'\x00', hashlib.sha256).digest()
-        v = hmac.new(k, v, hashlib.sha256).digest()
+        # Geçersiz k veya reddedilen aday, tekrar dene
+        prf = _hmac_sha256_prf(prf(v + b'\x00'))
+        v = prf(v)
 
 
 def sign_message(private_key: int, message: bytes, curve: Curve) -> Signature:
     """Bir mesajı özel anahtarla imzalar (RFC 6979 kullanarak)."""
     msg_hash = hashlib.sha256(message).digest()
+    msg_hash_int = int.from_bytes(msg_hash, 'big')
 
-    k = _rfc6979_k(private_key, msg_hash, curve)
-    r_point = k * curve.g
-    r = r_point.x % curve.n
-    if r == 0:
-        # Çok nadir bir durum, standartlar yeniden denemeyi gerektirir.
-        return sign_message(private_key, message, curve)
+    for k in _rfc6979_nonces(private_key, msg_hash, curve):
+        r_point = k * curve.g
+        r = r_point.x % curve.n
+        if r == 0:
+            # Çok nadir bir durum; standart bir sonraki k adayıyla devam eder.
+            continue
 
-    s = (pow(k, -1, curve.n) * (int.from_bytes(msg_hash, 'big') + r * private_key)) % curve.n
-    if s == 0:
-        # Bu da çok nadir bir durum.
-        return sign_message(private_key, message, curve)
+        s = (pow(k, -1, curve.n) * (msg_hash_int + r * private_key)) % curve.n
+        if s == 0:
+            # Bu da çok nadir bir durum.
+            continue
 
-    return (r, s)
+        return (r, s)
 
 
-def verify_signature(public_key: Point, message: bytes, signature: Signature) -> bool:
-    """Bir imzanın, verilen mesaj ve ortak anahtar için geçerli olup olmadığını doğrular."""
+def _verification_point(public_key: Point, message: bytes, signature: Signature):
+    """
+    u1*G + u2*Q noktasını Jakoben koordinatlarında döndürür.
+    İmza bileşenleri [1, n-1] aralığında değilse None döner.
+    """
     curve = public_key.curve
     msg_hash_int = int.from_bytes(hashlib.sha256(message).digest(), 'big')
     r, s = signature
 
     if not (1 <= r < curve.n and 1 <= s < curve.n):
-        return False
+        return None
 
     s_inv = pow(s, -1, curve.n)
     u1 = (msg_hash_int * s_inv) % curve.n
     u2 = (r * s_inv) % curve.n
 
-    p = u1 * curve.g + u2 * public_key
+    return _shamir_mul(u1, curve.g, u2, public_key, curve)
+
 
-    if p.is_identity:
+def _x_matches_r(point, r: int, curve: Curve) -> bool:
+    """
+    Jakoben (X, Y, Z) noktası için x_afin mod n == r olup olmadığını ters alma
+    yapmadan kontrol eder: x_afin = X / Z^2 olduğundan X ≡ r' * Z^2 (mod p) aranır.
+    r' adayları r, r + n, ... değerleridir (p'den küçük oldukları sürece).
+    """
+    X, _, Z = point
+    if Z == 0:
+        return False
+
+    p = curve.p
+    z_sq = (Z * Z) % p
+    candidate = r
+    while candidate < p:
+        if (X - candidate * z_sq) % p == 0:
+            return True
+        candidate += curve.n
+    return False
+
+
+def verify_signature(public_key: Point, message: bytes, signature: Signature) -> bool:
+    """Bir imzanın, verilen mesaj ve ortak anahtar için geçerli olup olmadığını doğrular."""
+    p = _verification_point(public_key, message, signature)
+
+    if p is None:
         return False
 
-    return p.x % curve.n == r
+    return _x_matches_r((p.X, p.Y, p.Z), signature[0], public_key.curve)
+
+
+def batch_verify(items: Iterable[Tuple[Point, bytes, Signature]]) -> List[bool]:
+    """
+    Birbirinden bağımsız (ortak_anahtar, mesaj, imza) üçlülerini toplu olarak doğrular.
+    Her imza için u1*G + u2*Q Jakoben koordinatlarında hesaplanır ve r ile ters alma
+    yapılmadan karşılaştırılır; hiçbir imza için afin dönüşüm gerekmez.
+    Girdi sırasıyla eşleşen bir bool listesi döner.
+    """
+    return [verify_signature(public_key, message, signature) for public_key, message, signature in items]
 
 
 # --- Örnek Kullanım ---
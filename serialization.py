@@ -1,3 +1,5 @@
+import functools
+
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import ec
 from cryptography.hazmat.primitives.asymmetric.utils import (
@@ -91,19 +93,31 @@ def deserialize_private_key(pem_bytes: bytes) -> tuple[int, Curve]:
     return private_numbers.private_value, curve
 
 
-def deserialize_public_key(pem_bytes: bytes) -> Point:
-    """PEM dosyasından ortak anahtarı okur."""
+@functools.lru_cache(maxsize=1024)
+def _parse_pem_pub(pem_bytes: bytes) -> tuple[str, int, int]:
+    """
+    PEM baytlarından (eğri adı, x, y) üçlüsünü ayrıştırır; aynı içerik tekrar
+    okunduğunda önbellekten döner. Yalnızca ortak anahtarlar önbelleğe alınır;
+    önbellek gerektiğinde _parse_pem_pub.cache_clear() ile boşaltılabilir.
+    """
     public_key_obj = serialization.load_pem_public_key(pem_bytes)
     if not isinstance(public_key_obj, ec.EllipticCurvePublicKey):
         raise TypeError("PEM dosyası bir eliptik eğri ortak anahtarı içermiyor.")
-    
+
     curve_name = public_key_obj.curve.name
     if curve_name not in AVAILABLE_CURVES:
         raise ValueError(f"PEM dosyasından okunan eğri desteklenmiyor: {curve_name}")
-    
-    curve = AVAILABLE_CURVES[curve_name]
+
     public_numbers = public_key_obj.public_numbers()
-    return Point(curve, public_numbers.x, public_numbers.y)
+    return curve_name, public_numbers.x, public_numbers.y
+
+
+def deserialize_public_key(pem_bytes: bytes) -> Point:
+    """PEM dosyasından ortak anahtarı okur."""
+    curve_name, x, y = _parse_pem_pub(bytes(pem_bytes))
+    # 'cryptography' yüklerken noktanın eğri üzerinde olduğunu zaten doğrular.
+    # Her çağrıda yeni bir Point döner; önbellekteki değerler paylaşılmaz.
+    return Point(AVAILABLE_CURVES[curve_name], x, y, _validate=False)
 
 def serialize_signature(signature: Signature) -> bytes:
     """İmzayı (r,s) DER formatına serileştirir."""
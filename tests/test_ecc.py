@@ -8,10 +8,39 @@ import subprocess
 # Proje kök dizinini Python yoluna ekle
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from ecc_core import Point
+from ecc_core import Point, _shamir_mul, fixed_base_mul, _batch_to_affine, _from_jacobian
 from ecdh import generate_key_pair as ecdh_generate_key_pair, derive_shared_secret
-from ecdsa import sign_message, verify_signature, generate_key_pair as ecdsa_generate_key_pair
+from ecdsa import (
+    sign_message, verify_signature, batch_verify, _x_matches_r, generate_key_pair as ecdsa_generate_key_pair
+)
 from curves import secp256k1, secp256r1
+from serialization import (
+    serialize_private_key, serialize_public_key, deserialize_private_key, deserialize_public_key
+)
+
+
+def _affine_add(curve, p1, p2):
+    """Afin koordinatlarda ders kitabı toplama formülü (Jakoben koddan bağımsız başvuru)."""
+    if p1 is None:
+        return p2
+    if p2 is None:
+        return p1
+    p = curve.p
+    (x1, y1), (x2, y2) = p1, p2
+    if x1 == x2 and (y1 + y2) % p == 0:
+        return None
+    if p1 == p2:
+        lam = (3 * x1 * x1 + curve.a) * pow(2 * y1, -1, p) % p
+    else:
+        lam = (y2 - y1) * pow(x2 - x1, -1, p) % p
+    x3 = (lam * lam - x1 - x2) % p
+    return (x3, (lam * (x1 - x3) - y1) % p)
+
+
+def _affine(curve, jac):
+    """Jakoben bir demeti (x, y) afin demetine çevirir; sonsuzdaki nokta için None."""
+    point = _from_jacobian(jac, curve)
+    return None if point.is_at_infinity() else (point.x, point.y)
 
 
 class TestECC(unittest.TestCase):
@@ -32,6 +61,123 @@ class TestECC(unittest.TestCase):
         p3_add = p2_mul + p1
         self.assertEqual(p3_mul, p3_add, "3*G ve (2*G)+G aynı sonucu vermeli.")
 
+        # Test 3: Aynı koordinatlara sahip farklı nesneler ve P + (-P)
+        self.assertEqual(p1 + Point(secp256k1, p1.x, p1.y), p2_mul, "G + G (kopya) ve 2*G aynı olmalı.")
+        self.assertTrue((p1 + (-p1)).is_identity, "G + (-G) birim eleman olmalı.")
+
+        # Test 4: [0, p) dışındaki koordinatlarla verilen nokta, indirgenmiş haliyle aynı davranmalı
+        for curve in (secp256k1, secp256r1):
+            g = curve.g
+            shifted = Point(curve, g.x + curve.p, g.y)
+            self.assertEqual(shifted + g, 2 * g, "Aralık dışı x ile G + G, 2*G olmalı.")
+            self.assertEqual(Point(curve, g.x + curve.p, g.y) * 5, 5 * g, "Aralık dışı x ile 5*G hesaplanmalı.")
+            self.assertEqual(Point(curve, g.x, g.y + curve.p) + g, 2 * g, "Aralık dışı y ile G + G, 2*G olmalı.")
+
+        # Test 5: Jakoben sonuçlarla zincirleme işlemler ve negatif
+        self.assertTrue((p3_add + (-p3_mul)).is_identity, "P + (-P) birim eleman olmalı.")
+        self.assertEqual(p3_add + p2_mul, 5 * p1, "(3*G)+(2*G) ve 5*G aynı sonucu vermeli.")
+
+    def test_scalar_multiplication_matches_naive(self):
+        """Skaler çarpım, basit ardışık toplamayla aynı sonucu vermeli."""
+        for curve in (secp256k1, secp256r1):
+            acc = Point(curve, None, None)
+            for k in range(1, 40):
+                acc = acc + curve.g
+                self.assertEqual(k * curve.g, acc, f"{k}*G ardışık toplamla eşleşmeli.")
+            self.assertTrue(((curve.n - 1) * curve.g + curve.g).is_at_infinity())
+            self.assertEqual(-3 * curve.g, -(3 * curve.g))
+
+    def test_shamir_mul_matches_separate_products(self):
+        """Shamir hilesi, iki ayrı çarpımın toplamıyla aynı sonucu vermeli."""
+        for curve in (secp256k1, secp256r1):
+            q = secrets.randbelow(curve.n - 1) + 1
+            q_point = q * curve.g
+            for k1, k2 in [(0, 5), (7, 0), (1, 1), (q, curve.n - q),
+                           (secrets.randbelow(curve.n), secrets.randbelow(curve.n))]:
+                expected = k1 * curve.g + k2 * q_point
+                self.assertEqual(_shamir_mul(k1, curve.g, k2, q_point, curve), expected)
+
+    def test_fixed_base_mul_matches_scalar_mul(self):
+        """Sabit taban tablosuyla k*G, genel skaler çarpımla (k/2)*(2G) aynı olmalı."""
+        for curve in (secp256k1, secp256r1):
+            two_g = 2 * curve.g
+            half = pow(2, -1, curve.n)
+            for k in [1, 2, 15, 16, 17, curve.n - 1, curve.n, curve.n + 3, secrets.randbelow(curve.n)]:
+                expected = ((k * half) % curve.n) * two_g
+                self.assertEqual(fixed_base_mul(k, curve), expected, f"k={k} için sonuç eşleşmeli.")
+                self.assertEqual(k * curve.g, expected)
+
+    def test_batch_to_affine_matches_single_conversion(self):
+        """Toplu ters alma, her noktayı tek tek afine çevirmekle aynı sonucu vermeli."""
+        curve = secp256r1
+        points = [(curve.g.x, curve.g.y, 1)]
+        for _ in range(6):
+            points.append(curve._double(points[-1], curve))
+        points.insert(3, (1, 1, 0))
+
+        for jac, aff in zip(points, _batch_to_affine(points, curve.p)):
+            self.assertEqual(_from_jacobian(jac, curve), _from_jacobian(aff, curve))
+
+    def test_mixed_addition_matches_affine_sum(self):
+        """z = 1 işlenenli (karma) toplama, afin başvuru toplamıyla aynı olmalı (P = Q dahil)."""
+        for curve in (secp256k1, secp256r1):
+            g = (curve.g.x, curve.g.y)
+            two = _affine_add(curve, g, g)
+            four = _affine_add(curve, two, two)
+            p_jac = curve._double(curve._double((g[0], g[1], 1), curve), curve)  # 4G, z != 1
+            self.assertEqual(_affine(curve, curve._add(p_jac, (g[0], g[1], 1), curve)),
+                             _affine_add(curve, four, g))
+            self.assertEqual(_affine(curve, curve._add(p_jac, (four[0], four[1], 1), curve)),
+                             _affine_add(curve, four, four))
+            self.assertIsNone(_affine(curve, curve._add(p_jac, (four[0], curve.p - four[1], 1), curve)))
+
+    def test_rfc6979_known_answer_p256(self):
+        """RFC 6979, Ek A.2.5 (P-256, SHA-256, "sample") test vektörüyle aynı imza üretilmeli."""
+        private_key = 0xC9AFA9D845BA75166B5C215767B1D6934E50C3DB36E89B127B8A622B120F6721
+        r, s = sign_message(private_key, b"sample", secp256r1)
+        self.assertEqual(r, 0xEFD48B2AACB6A8FD1140DD9CD45E81D69D2C877B56AAF991C34D0EA84EAF3716)
+        self.assertEqual(s, 0xF7CB1C942D657C41D436C7A1B6E29F65F3E900DBB9AFF4064DC4AB2F843ACDA8)
+
+    def test_specialized_formulas_match_reference(self):
+        """Eğriye özel üretilen fonksiyonlar, afin başvuru formülleriyle aynı sonucu vermeli."""
+        for curve in (secp256k1, secp256r1):
+            g = (curve.g.x, curve.g.y)
+            two = _affine_add(curve, g, g)
+            four = _affine_add(curve, two, two)
+            p_jac = curve._double((g[0], g[1], 1), curve)  # 2G
+            q_jac = curve._double(p_jac, curve)  # 4G
+            self.assertEqual(_affine(curve, p_jac), two)
+            self.assertEqual(_affine(curve, q_jac), four)
+            self.assertEqual(_affine(curve, curve._add(p_jac, q_jac, curve)), _affine_add(curve, two, four))
+            self.assertEqual(_affine(curve, curve._add(q_jac, q_jac, curve)), _affine_add(curve, four, four))
+
+    def test_pem_roundtrip_is_cached(self):
+        """PEM anahtarları doğru okunmalı; ortak anahtar önbelleği paylaşılan nesne döndürmemeli."""
+        private_key, public_key = ecdsa_generate_key_pair(secp256r1)
+        priv_pem = serialize_private_key(private_key, public_key)
+        pub_pem = serialize_public_key(public_key)
+
+        self.assertEqual(deserialize_private_key(priv_pem), (private_key, secp256r1))
+        loaded = deserialize_public_key(pub_pem)
+        self.assertEqual(loaded, public_key)
+        again = deserialize_public_key(pub_pem)
+        self.assertEqual(again, loaded)
+        self.assertIsNot(again, loaded)
+
+    def test_x_matches_r_without_inversion(self):
+        """Jakoben x karşılaştırması, afin x mod n ile aynı kararı vermeli (r + n durumu dahil)."""
+        for curve in (secp256k1, secp256r1):
+            point = 7 * (5 * curve.g)
+            jac = (point.X, point.Y, point.Z)
+            x = point.x
+            self.assertTrue(_x_matches_r(jac, x % curve.n, curve))
+            self.assertFalse(_x_matches_r(jac, (x + 1) % curve.n, curve))
+            self.assertFalse(_x_matches_r((1, 1, 0), x % curve.n, curve))
+
+            # n <= x_afin < p durumu: r = x_afin - n, yalnızca r + n adayıyla eşleşir.
+            x = curve.n + 1
+            self.assertTrue(_x_matches_r((x * 4, 1, 2), x - curve.n, curve))
+
     def test_cli_full_flow_secp256r1(self):
         """
         Komut satırı arayüzünün (CLI) secp256r1 eğrisiyle tam akışını test eder.
@@ -107,6 +253,24 @@ class TestECC(unittest.TestCase):
         wrong_private_key, wrong_public_key = ecdsa_generate_key_pair(secp256k1)
         self.assertFalse(verify_signature(wrong_public_key, message, signature), "Yanlış anahtarla doğrulama başarısız olmalı.")
 
+    def test_batch_verify_matches_individual(self):
+        """Toplu doğrulama, her imzayı tek tek doğrulamakla aynı sonuçları vermeli."""
+        items = []
+        for curve in (secp256k1, secp256r1):
+            for i in range(3):
+                private_key, public_key = ecdsa_generate_key_pair(curve)
+                message = f"toplu mesaj {i}".encode()
+                items.append((public_key, message, sign_message(private_key, message, curve)))
+        # Geçersiz girdiler: yanlış mesaj, aralık dışı imza ve değiştirilmiş s
+        pk, msg, (r, s) = items[0]
+        items.append((pk, b"yanlis", (r, s)))
+        items.append((pk, msg, (0, s)))
+        items.append((items[4][0], items[4][1], (items[4][2][0], items[4][2][1] ^ 1)))
+
+        expected = [verify_signature(pk, msg, sig) for pk, msg, sig in items]
+        self.assertEqual(batch_verify(items), expected)
+        self.assertEqual(expected, [True] * 6 + [False] * 3)
+
 
 if __name__ == '__main__':
     unittest.main()